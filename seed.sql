@@ -87,12 +87,26 @@ CREATE TABLE checking_risk_scores (
 CREATE TABLE checking_accounts (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
     checking_application_id UUID NOT NULL REFERENCES checking_applications(id) ON DELETE CASCADE,
-    account_number TEXT NOT NULL,
+    -- derived from the application id, so let Postgres own it
+    account_number TEXT UNIQUE GENERATED ALWAYS AS (
+        '10' || substr(replace(checking_application_id::text, '-', ''), 1, 10)
+    ) STORED,
     routing_number TEXT,
     status TEXT NOT NULL,
     -- ACTIVE, PENDING_FUNDING, CLOSED, etc.
     created_at TIMESTAMPTZ DEFAULT now()
 );
+-- One ACTIVE account per application; also makes the API's
+-- "already has an account" probe a single index lookup
+CREATE UNIQUE INDEX checking_accounts_one_active_per_app ON checking_accounts (checking_application_id)
+WHERE status = 'ACTIVE';
+-- FK indexes so the per-application child lookups (owners, documents,
+-- risk scores, accounts) stay index scans as the tables grow
+CREATE INDEX ix_checking_owners_checking_application_id ON checking_owners (checking_application_id);
+CREATE INDEX ix_checking_documents_checking_application_id ON checking_documents (checking_application_id);
+CREATE INDEX ix_checking_risk_scores_checking_application_id ON checking_risk_scores (checking_application_id);
+CREATE INDEX ix_checking_accounts_checking_application_id ON checking_accounts (checking_application_id);
+CREATE INDEX ix_businesses_customer_id ON businesses (customer_id);
 -- =========================================================
 -- 4. Lending / credit-line tables
 -- =========================================================
@@ -141,7 +155,7 @@ CREATE TABLE business_credit_reports (
     bankruptcies_count INT,
     public_records_count INT,
     utilization_ratio NUMERIC,
-    last_updated_at TIMESTAMPTZ
+    last_updated_at TIMESTAMPTZ DEFAULT now()
 );
 -- Underwriting results for lending
 CREATE TABLE lending_underwriting (
@@ -217,6 +231,15 @@ CREATE TABLE notifications (
     delivery_status TEXT NOT NULL DEFAULT 'SENT',
     created_at TIMESTAMPTZ DEFAULT now()
 );
+CREATE INDEX ix_notifications_context_id ON notifications (context_id);
+-- Latest-per-application lookups: composite DESC indexes make each a
+-- single Index Scan with LIMIT 1 instead of a scan + sort on the FK alone
+CREATE INDEX ix_ltxsum_app_created ON lending_transaction_summaries (lending_application_id, created_at DESC);
+CREATE INDEX ix_bcr_app_updated ON business_credit_reports (lending_application_id, last_updated_at DESC);
+-- one report per (application, bureau); backs the upsert in credit_report/pull
+CREATE UNIQUE INDEX ux_bcr_app_bureau ON business_credit_reports (lending_application_id, bureau);
+CREATE INDEX ix_lunderwriting_app_created ON lending_underwriting (lending_application_id, created_at DESC);
+CREATE INDEX ix_offer_app_id ON lending_offers (lending_application_id, id);
 -- =========================================================
 -- 6. Seed data
 -- =========================================================
@@ -349,17 +372,16 @@ VALUES (
         '{}'
     );
 -- 6.6 Seed one checking account as if it was opened
+-- (account_number is generated from the application id)
 INSERT INTO checking_accounts (
         id,
         checking_application_id,
-        account_number,
         routing_number,
         status
     )
 VALUES (
         '55555555-5555-5555-5555-555555555555',
         '22222222-2222-2222-2222-222222222222',
-        '1000000001',
         '011000015',
         'ACTIVE'
     );
@@ -587,4 +609,224 @@ VALUES (
         'APPROVED',
         ARRAY ['GOOD_BUREAU_SCORE', 'HEALTHY_CASHFLOW'],
         'SENT'
-    );
\ No newline at end of file
+    );-- =========================================================
+-- 7. Server-side onboarding decision
+-- =========================================================
+-- Runs the whole checking onboarding flow (completeness, eligibility,
+-- verifications, documents, risk, account opening, notification) in one
+-- database call so automated orchestrators pay one round-trip, not eight.
+-- Mirrors the toy rules in checking_api.py.
+CREATE OR REPLACE FUNCTION checking_onboarding_decide(app_id UUID) RETURNS TABLE (
+        decision TEXT,
+        reason_codes TEXT [],
+        risk_score INT,
+        risk_band TEXT,
+        account_id UUID,
+        account_number TEXT,
+        notification_id UUID,
+        reference TEXT
+    ) AS $$
+DECLARE app checking_applications %ROWTYPE;
+biz businesses %ROWTYPE;
+codes TEXT [] := '{}';
+score INT := 20;
+band TEXT;
+cash_vol NUMERIC;
+owner_count INT;
+bad_owner_count INT;
+missing_doc_count INT;
+rejected_doc_count INT;
+acc_id UUID;
+acc_num TEXT;
+notif_id UUID;
+BEGIN
+SELECT * INTO app
+FROM checking_applications
+WHERE id = app_id;
+IF NOT FOUND THEN RAISE EXCEPTION 'checking application % not found',
+app_id;
+END IF;
+SELECT * INTO biz
+FROM businesses
+WHERE id = app.business_id;
+-- completeness
+IF biz.tax_id IS NULL THEN codes := codes || 'BUSINESS_TAX_ID';
+END IF;
+IF biz.address IS NULL THEN codes := codes || 'BUSINESS_ADDRESS';
+END IF;
+IF app.usage_profile IS NULL THEN codes := codes || 'USAGE_PROFILE_MISSING';
+END IF;
+SELECT count(*),
+    count(*) FILTER (
+        WHERE o.national_id IS NULL
+            OR o.dob IS NULL
+    ) INTO owner_count,
+    bad_owner_count
+FROM checking_owners o
+WHERE o.checking_application_id = app_id;
+IF owner_count = 0 THEN codes := codes || 'OWNERS_MISSING';
+ELSIF bad_owner_count > 0 THEN codes := codes || 'OWNER_VERIFICATION_FAILED';
+END IF;
+-- product eligibility
+IF biz.industry_code IN ('7995', '9999') THEN codes := codes || 'INDUSTRY_NOT_ALLOWED';
+END IF;
+IF biz.years_in_business IS NOT NULL
+AND biz.years_in_business < 1
+AND app.product_id ILIKE '%PREMIUM%' THEN codes := codes || 'MIN_AGE_OF_BUSINESS_NOT_MET';
+END IF;
+-- business verification
+IF biz.registration_number IS NULL THEN codes := codes || 'REGISTRATION_NOT_FOUND';
+END IF;
+-- documents
+SELECT count(*) INTO missing_doc_count
+FROM unnest(
+        ARRAY ['BUSINESS_REG_CERT', 'TAX_ID_PROOF', 'OWNER_ID_PROOF']
+    ) req(doc_type)
+WHERE req.doc_type NOT IN (
+        SELECT d.doc_type
+        FROM checking_documents d
+        WHERE d.checking_application_id = app_id
+    );
+SELECT count(*) INTO rejected_doc_count
+FROM checking_documents d
+WHERE d.checking_application_id = app_id
+    AND d.status = 'REJECTED';
+IF missing_doc_count > 0 THEN codes := codes || 'DOCUMENTS_MISSING';
+END IF;
+IF rejected_doc_count > 0 THEN codes := codes || 'DOCUMENTS_REJECTED';
+END IF;
+-- risk scoring
+IF biz.years_in_business IS NOT NULL
+AND biz.years_in_business < 1 THEN score := score + 30;
+END IF;
+cash_vol := COALESCE(
+    (
+        app.usage_profile->>'cash_deposit_volume_per_month'
+    )::NUMERIC,
+    0
+);
+IF cash_vol > 100000 THEN score := score + 30;
+END IF;
+IF biz.industry_code IN ('7995', '9999') THEN score := score + 20;
+END IF;
+IF score < 30 THEN band := 'LOW';
+ELSIF score < 70 THEN band := 'MEDIUM';
+ELSE band := 'HIGH';
+END IF;
+INSERT INTO checking_risk_scores (
+        checking_application_id,
+        risk_score,
+        risk_band,
+        driver_codes
+    )
+VALUES (app_id, score, band, ARRAY ['SERVER_SIDE_DECIDE']);
+IF cardinality(codes) = 0 THEN -- approved: open (or reuse) the account
+SELECT a.id,
+    a.account_number INTO acc_id,
+    acc_num
+FROM checking_accounts a
+WHERE a.checking_application_id = app_id
+LIMIT 1;
+IF acc_id IS NULL THEN
+INSERT INTO checking_accounts (
+        checking_application_id,
+        routing_number,
+        status
+    )
+VALUES (app_id, '011000015', 'ACTIVE')
+RETURNING checking_accounts.id,
+    checking_accounts.account_number INTO acc_id,
+    acc_num;
+END IF;
+UPDATE checking_applications
+SET status = 'DECIDED'
+WHERE id = app_id;
+INSERT INTO notifications (
+        context_type,
+        context_id,
+        channel,
+        decision,
+        reason_codes
+    )
+VALUES (
+        'CHECKING_APPLICATION',
+        app_id,
+        'EMAIL',
+        'APPROVED',
+        '{}'
+    )
+RETURNING notifications.id INTO notif_id;
+RETURN QUERY
+SELECT 'APPROVED'::TEXT,
+    codes,
+    score,
+    band,
+    acc_id,
+    acc_num,
+    notif_id,
+    app.reference;
+ELSE
+UPDATE checking_applications
+SET status = 'DECIDED'
+WHERE id = app_id;
+INSERT INTO notifications (
+        context_type,
+        context_id,
+        channel,
+        decision,
+        reason_codes
+    )
+VALUES (
+        'CHECKING_APPLICATION',
+        app_id,
+        'EMAIL',
+        'REJECTED',
+        codes
+    )
+RETURNING notifications.id INTO notif_id;
+RETURN QUERY
+SELECT 'REJECTED'::TEXT,
+    codes,
+    score,
+    band,
+    NULL::UUID,
+    NULL::TEXT,
+    notif_id,
+    app.reference;
+END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+-- =========================================================
+-- 8. Denormalized read model for lending application lookups
+-- =========================================================
+-- Everything get_by_reference serves, flattened so one index scan on
+-- reference replaces the customers/businesses/checking_accounts JOINs.
+-- The lending API refreshes this every CONTEXT_REFRESH_INTERVAL seconds
+-- (default 5) with:
+--   REFRESH MATERIALIZED VIEW CONCURRENTLY lending_application_context;
+CREATE MATERIALIZED VIEW lending_application_context AS
+SELECT a.id,
+    a.reference,
+    a.status,
+    a.submitted_at,
+    a.product_type,
+    a.requested_amount,
+    c.id AS customer_id,
+    c.segment,
+    b.id AS business_id,
+    b.legal_name,
+    b.trade_name,
+    b.industry_code,
+    b.entity_type,
+    b.years_in_business,
+    b.country,
+    b.state,
+    b.city,
+    ca.id AS checking_account_id
+FROM lending_applications a
+    JOIN customers c ON c.id = a.customer_id
+    JOIN businesses b ON b.id = a.business_id
+    JOIN checking_accounts ca ON ca.id = a.checking_account_id;
+-- required for REFRESH ... CONCURRENTLY, and the lookup path itself
+CREATE UNIQUE INDEX ux_lapp_context_reference ON lending_application_context (reference);
@@ -0,0 +1,47 @@
+"""Field-type guard for the construct-path response models in lending_api.
+
+model_construct skips validation, so these assert the endpoint builders
+keep handing it correctly typed values — a future callsite feeding the
+construct path untrusted data should trip here first.
+"""
+
+import uuid
+
+from lending_api import Offer, RunLendingUnderwritingResponse
+
+
+def test_offer_construct_keeps_declared_types():
+    offer = Offer.model_construct(
+        offer_id=uuid.uuid4(),
+        product_type="REVOLVING_LOC",
+        credit_limit=40000.0,
+        min_credit_limit=20000.0,
+        max_credit_limit=50000.0,
+        apr=0.14,
+        annual_fee=0.0,
+        origination_fee=0.01,
+        tenor_months=None,
+        repayment_terms="REVOLVING",
+        collateral_required=False,
+        notes="Based on your revenue and bureau data.",
+    )
+    assert isinstance(offer.offer_id, uuid.UUID)
+    assert isinstance(offer.credit_limit, float)
+    assert isinstance(offer.collateral_required, bool)
+    assert offer.tenor_months is None
+
+
+def test_underwriting_construct_keeps_declared_types():
+    resp = RunLendingUnderwritingResponse.model_construct(
+        underwriting_id=uuid.uuid4(),
+        risk_grade="A",
+        pd_estimate=0.02,
+        lgd_estimate=0.45,
+        recommended_max_exposure=100000.0,
+        affordability_band="MEDIUM",
+        key_risk_drivers=["GOOD_BUREAU_SCORE"],
+        supporting_metrics={"dscr": 1.8, "debt_to_revenue_ratio": 0.25},
+    )
+    assert isinstance(resp.underwriting_id, uuid.UUID)
+    assert isinstance(resp.pd_estimate, float)
+    assert resp.key_risk_drivers == ["GOOD_BUREAU_SCORE"]
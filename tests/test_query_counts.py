@@ -0,0 +1,169 @@
+"""Query-count regression tests for the checking onboarding endpoints.
+
+These guard the eager-loading setup: a refactor that reintroduces a lazy
+relationship load shows up here as an extra SELECT per request. They need a
+real (scratch) Postgres because the models use JSONB/ARRAY/UUID columns —
+point TEST_DATABASE_URL at one (postgresql+asyncpg://...) to run them.
+"""
+
+import asyncio
+import os
+import uuid
+from contextlib import contextmanager
+from datetime import date
+
+import pytest
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    TEST_DATABASE_URL is None,
+    reason="set TEST_DATABASE_URL to a scratch Postgres to run query-count tests",
+)
+
+
+@contextmanager
+def count_queries(sync_engine):
+    """Collect every statement the engine sends while the block runs."""
+    statements = []
+
+    def before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        statements.append(statement)
+
+    from sqlalchemy import event
+
+    event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+class _UnavailableRedis:
+    """Stand-in client so tests never depend on a running Redis."""
+
+    def __getattr__(self, name):
+        async def _fail(*args, **kwargs):
+            import redis.asyncio as redis
+
+            raise redis.RedisError("redis disabled in tests")
+
+        return _fail
+
+
+@pytest.fixture()
+def api(monkeypatch):
+    import checking_api
+    from fastapi.testclient import TestClient
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    engine = create_async_engine(TEST_DATABASE_URL)
+    SessionLocal = async_sessionmaker(
+        bind=engine, autoflush=False, expire_on_commit=False
+    )
+    monkeypatch.setattr(checking_api, "engine", engine)
+    monkeypatch.setattr(checking_api, "SessionLocal", SessionLocal)
+    monkeypatch.setattr(checking_api, "redis_client", _UnavailableRedis())
+
+    app_id = uuid.uuid4()
+    reference = f"CHK-APP-TEST-{app_id.hex[:8]}"
+
+    async def _seed():
+        async with engine.begin() as conn:
+            await conn.run_sync(checking_api.Base.metadata.create_all)
+        async with SessionLocal() as db:
+            customer_id = f"CUST-TEST-{app_id.hex[:8]}"
+            business_id = uuid.uuid4()
+            db.add(
+                checking_api.Customer(
+                    id=customer_id, name="Test Owner", segment="MICRO_SMB"
+                )
+            )
+            db.add(
+                checking_api.Business(
+                    id=business_id,
+                    customer_id=customer_id,
+                    legal_name="Test Incorporated",
+                    entity_type="LLC",
+                    tax_id="99-0000000",
+                    registration_number="REG-TEST-001",
+                    industry_code="5415",
+                    country="US",
+                    address="1 Test Street",
+                    years_in_business=3,
+                )
+            )
+            db.add(
+                checking_api.CheckingApplication(
+                    id=app_id,
+                    reference=reference,
+                    business_id=business_id,
+                    customer_id=customer_id,
+                    product_id="BUSINESS_CHECKING_STANDARD",
+                    status="RECEIVED",
+                    usage_profile={"cash_deposit_volume_per_month": 5000},
+                )
+            )
+            for i in range(3):
+                db.add(
+                    checking_api.CheckingOwner(
+                        checking_application_id=app_id,
+                        full_name=f"Owner {i}",
+                        dob=date(1985, 1, 1),
+                        national_id=f"ID-{i}",
+                        ownership_percentage=30,
+                    )
+                )
+            for doc_type in ("BUSINESS_REG_CERT", "TAX_ID_PROOF", "OWNER_ID_PROOF"):
+                db.add(
+                    checking_api.CheckingDocument(
+                        checking_application_id=app_id,
+                        doc_type=doc_type,
+                        status="VALIDATED",
+                        reason_codes=[],
+                    )
+                )
+            await db.commit()
+
+    asyncio.run(_seed())
+    with TestClient(checking_api.app) as client:
+        yield client, engine.sync_engine, app_id, reference
+    asyncio.run(engine.dispose())
+
+
+def test_get_by_reference_query_count(api):
+    client, sync_engine, app_id, reference = api
+    with count_queries(sync_engine) as q:
+        resp = client.post(
+            "/checking/applications/get_by_reference",
+            json={"reference": reference},
+        )
+    assert resp.status_code == 200
+    # one application SELECT (business joined in) + one selectin for owners —
+    # the only relationships ApplicationData serializes
+    assert len(q) <= 2, q
+
+
+def test_evaluate_documents_query_count(api):
+    client, sync_engine, app_id, reference = api
+    with count_queries(sync_engine) as q:
+        resp = client.post(
+            "/checking/applications/evaluate_documents",
+            json={"application_id": str(app_id)},
+        )
+    assert resp.status_code == 200
+    assert len(q) <= 2, q
+
+
+def test_run_owner_verification_query_count(api):
+    client, sync_engine, app_id, reference = api
+    with count_queries(sync_engine) as q:
+        resp = client.post(
+            "/checking/applications/run_owner_verification",
+            json={"application_id": str(app_id)},
+        )
+    assert resp.status_code == 200
+    assert resp.json()["overall_status"] == "PASSED"
+    assert len(q) <= 2, q